@@ -0,0 +1,84 @@
+# Import necessary modules for encoding cached FAQ payloads
+import json  # Compact text encoding for the columnar layout
+import zlib  # Compression for payloads above the configured threshold
+from django.conf import settings  # Compression threshold and level
+from django.core.cache import cache  # Django caching framework holding the encoded payloads
+
+# Fields stored for every FAQ, written once per payload instead of once per entry
+FAQ_FIELDS = ('question', 'answer')
+
+# One-byte tags prefixed to every payload describing how the body is stored
+RAW_TAG = b'j'  # Uncompressed JSON
+ZLIB_TAG = b'z'  # zlib-compressed JSON
+
+
+def faq_cache_key(lang_code):
+    """
+    Return the cache key holding the FAQ list for a language.
+    """
+    return f"faq_translations_{lang_code}"
+
+
+def encode_faqs(faqs):
+    """
+    Encode a list of FAQ dicts into a compact bytes payload.
+
+    The FAQs are stored column by column (all questions, then all answers) so that
+    field names appear only once, and the result is zlib-compressed when it is at
+    least FAQ_CACHE_COMPRESS_MIN_BYTES long and compression actually saves space.
+    """
+    columns = [[faq[field] for faq in faqs] for field in FAQ_FIELDS]
+    body = json.dumps(
+        {'fields': FAQ_FIELDS, 'columns': columns},
+        separators=(',', ':'),
+        ensure_ascii=False,
+    ).encode('utf-8')
+
+    if len(body) >= getattr(settings, 'FAQ_CACHE_COMPRESS_MIN_BYTES', 1024):
+        compressed = zlib.compress(body, getattr(settings, 'FAQ_CACHE_COMPRESS_LEVEL', 6))
+        if len(compressed) < len(body):
+            return ZLIB_TAG + compressed
+    return RAW_TAG + body
+
+
+def decode_faqs(payload):
+    """
+    Decode a payload produced by encode_faqs back into a list of FAQ dicts.
+    Lists cached before the compact encoding was introduced are returned unchanged.
+    """
+    if isinstance(payload, list):
+        return payload
+
+    tag, body = payload[:1], payload[1:]
+    if tag == ZLIB_TAG:
+        body = zlib.decompress(body)
+    elif tag != RAW_TAG:
+        raise ValueError(f"Unknown FAQ payload encoding: {tag!r}")
+
+    document = json.loads(body)
+    fields = document['fields']
+    return [dict(zip(fields, row)) for row in zip(*document['columns'])]
+
+
+def get_cached_faqs(lang_code):
+    """
+    Return the cached FAQ list for a language, or None if it is not cached.
+    """
+    payload = cache.get(faq_cache_key(lang_code))
+    if payload is None:
+        return None
+    return decode_faqs(payload)
+
+
+def set_cached_faqs(lang_code, faqs):
+    """
+    Encode and cache the FAQ list for a language without expiry.
+    """
+    set_cached_payload(lang_code, encode_faqs(faqs))
+
+
+def set_cached_payload(lang_code, payload, timeout=None):
+    """
+    Cache an already encoded FAQ list for a language, without expiry unless a timeout is given.
+    """
+    cache.set(faq_cache_key(lang_code), payload, timeout=timeout)
@@ -0,0 +1,68 @@
+# Import necessary modules for benchmarking cold-cache FAQ list rebuilds
+import time  # High resolution timers
+from django.core.management.base import BaseCommand, CommandError
+from api.caching import encode_faqs
+from api.models import FAQ, FAQDocument, Language, Translation
+
+
+def scan_per_faq(language):
+    """
+    Rebuild a language's FAQ list the way FAQListView did before materialized documents:
+    one Translation query per FAQ.
+    """
+    rows = []
+    for faq in FAQ.objects.all():
+        translation = Translation.objects.filter(faq=faq, language=language).first() if language else None
+        source = translation or faq
+        rows.append({'question': source.question, 'answer': source.answer})
+    return encode_faqs(rows)
+
+
+def scan_joined(language):
+    """
+    Rebuild a language's FAQ list with one query per table.
+    """
+    return encode_faqs(FAQDocument.build_rows(language)[1])
+
+
+def mean_ms(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the cold-cache cost of producing each language's FAQ payload, "
+        "with and without the materialized FAQ documents."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20,
+                            help="Repetitions per measurement (default: 20).")
+        parser.add_argument('--lang', action='append', dest='langs',
+                            help="Language code to benchmark (repeatable, default: en and every Language).")
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations <= 0:
+            raise CommandError("--iterations must be positive")
+
+        codes = options['langs'] or ['en'] + list(Language.objects.exclude(code='en').values_list('code', flat=True))
+        self.stdout.write(f"{FAQ.objects.count()} FAQs, {iterations} iterations, mean ms per cold request")
+        self.stdout.write(f"{'lang':<8}{'per-FAQ scan':>14}{'joined scan':>14}{'document':>12}{'speedup':>10}")
+
+        for code in codes:
+            language = None if code == 'en' else Language.objects.filter(code=code).first()
+            document_code = code if language else 'en'  # Unknown languages are served the English document
+            if not FAQDocument.objects.filter(pk=document_code).exists():
+                FAQDocument.rebuild(document_code, language)  # Make sure the document exists before timing it
+
+            per_faq = mean_ms(lambda: scan_per_faq(language), iterations)
+            joined = mean_ms(lambda: scan_joined(language), iterations)
+            document = mean_ms(lambda: FAQDocument.load_payload(document_code, language), iterations)
+
+            self.stdout.write(
+                f"{code:<8}{per_faq:>14.2f}{joined:>14.2f}{document:>12.2f}{per_faq / document if document else 0:>9.1f}x"
+            )
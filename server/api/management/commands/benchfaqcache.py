@@ -0,0 +1,77 @@
+# Import necessary modules for benchmarking the FAQ cache encoding
+import pickle  # Baseline: the pickled list of dicts the cache used to store
+import time  # High resolution timers
+from django.core.management.base import BaseCommand, CommandError
+from api.caching import decode_faqs, encode_faqs
+from api.models import FAQ
+from api.serializers import FAQSerializer
+
+
+def synthetic_faqs(count, answer_size):
+    """
+    Build a list of FAQ dicts with HTML answers of roughly answer_size characters.
+    """
+    faqs = []
+    for i in range(count):
+        paragraph = f"<p>Answer {i}: this FAQ explains <strong>topic {i}</strong> in detail.</p>"
+        faqs.append({
+            'question': f"How does feature {i} work?",
+            'answer': (paragraph * (answer_size // len(paragraph) + 1))[:answer_size],
+        })
+    return faqs
+
+
+def time_per_call(func, arg, iterations):
+    """
+    Return the mean duration of func(arg) in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+class Command(BaseCommand):
+    help = "Benchmark encode/decode cost of the compact FAQ cache encoding against the memory it saves."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--faqs', type=int, default=200,
+                            help="Number of synthetic FAQs (default: 200).")
+        parser.add_argument('--answer-size', type=int, default=2000,
+                            help="Approximate length of each synthetic HTML answer (default: 2000).")
+        parser.add_argument('--iterations', type=int, default=200,
+                            help="Encode/decode iterations per measurement (default: 200).")
+        parser.add_argument('--from-db', action='store_true',
+                            help="Benchmark the English FAQs stored in the database instead of synthetic data.")
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations <= 0:
+            raise CommandError("--iterations must be positive")
+
+        if options['from_db']:
+            faqs = [dict(faq) for faq in FAQSerializer(FAQ.objects.all(), many=True).data]
+        else:
+            faqs = synthetic_faqs(options['faqs'], options['answer_size'])
+
+        pickled = pickle.dumps(faqs, pickle.HIGHEST_PROTOCOL)
+        encoded = encode_faqs(faqs)
+        if decode_faqs(encoded) != faqs:
+            raise CommandError("Round trip through the compact encoding did not reproduce the input")
+
+        rows = [
+            ('pickle', len(pickled),
+             time_per_call(lambda data: pickle.dumps(data, pickle.HIGHEST_PROTOCOL), faqs, iterations),
+             time_per_call(pickle.loads, pickled, iterations)),
+            ('compact', len(encoded),
+             time_per_call(encode_faqs, faqs, iterations),
+             time_per_call(decode_faqs, encoded, iterations)),
+        ]
+
+        self.stdout.write(f"{len(faqs)} FAQs, {iterations} iterations")
+        self.stdout.write(f"{'format':<10}{'bytes':>12}{'encode us':>12}{'decode us':>12}")
+        for name, size, encode_us, decode_us in rows:
+            self.stdout.write(f"{name:<10}{size:>12}{encode_us:>12.1f}{decode_us:>12.1f}")
+
+        saved = len(pickled) - len(encoded)
+        self.stdout.write(f"Memory saved per cached language: {saved} bytes ({saved / len(pickled):.1%})")
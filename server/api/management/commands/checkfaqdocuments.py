@@ -0,0 +1,58 @@
+# Import necessary modules for checking the materialized FAQ documents
+from django.core.cache import cache  # Cached payloads are cleared for repaired documents
+from django.core.management.base import BaseCommand, CommandError
+from api.caching import decode_faqs, faq_cache_key
+from api.models import FAQDocument, Language
+from api.routers import primary_reads  # Compare against the primary: repairs must never store replica data
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare every materialized FAQ document with the FAQ and Translation tables "
+        "and report missing, stale and orphaned documents."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true',
+                            help="Rebuild missing or stale documents and delete orphaned ones.")
+
+    def handle(self, *args, **options):
+        with primary_reads():
+            self.check_documents(options['repair'])
+
+    def check_documents(self, repair):
+        languages = {'en': None}
+        languages.update((language.code, language) for language in Language.objects.exclude(code='en'))
+        documents = {document.language_code: document for document in FAQDocument.objects.all()}
+
+        problems = 0
+        for code, language in languages.items():
+            faq_ids, rows = FAQDocument.build_rows(language)
+            document = documents.pop(code, None)
+
+            if document is None:
+                status = 'missing'
+            elif document.faq_ids != faq_ids or decode_faqs(bytes(document.payload)) != rows:
+                status = 'stale'
+            else:
+                self.stdout.write(f"{code}: ok ({len(faq_ids)} FAQs)")
+                continue
+
+            problems += 1
+            if repair:
+                FAQDocument.rebuild(code, language)
+                cache.delete(faq_cache_key(code))
+                status += ', rebuilt'
+            self.stdout.write(f"{code}: {status}")
+
+        # Documents left over belong to languages that no longer exist
+        for code in documents:
+            problems += 1
+            if repair:
+                FAQDocument.objects.filter(pk=code).delete()
+                cache.delete(faq_cache_key(code))
+            self.stdout.write(f"{code}: orphaned{', deleted' if repair else ''}")
+
+        if problems and not repair:
+            raise CommandError(f"{problems} inconsistent FAQ document(s); run with --repair to fix them")
+        self.stdout.write(f"Checked {len(languages)} language(s), {problems} problem(s) found")
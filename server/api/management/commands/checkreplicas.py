@@ -0,0 +1,28 @@
+# Import necessary modules for checking read replica health
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.routers import get_replica_router
+
+
+class Command(BaseCommand):
+    help = "Check the health of the FAQ read replicas and show where FAQ reads are currently routed."
+
+    def handle(self, *args, **options):
+        replica_router = get_replica_router()
+        if replica_router is None:
+            raise CommandError("api.routers.FAQReplicaRouter is not listed in DATABASE_ROUTERS")
+
+        replicas = getattr(settings, 'FAQ_READ_REPLICAS', [])
+        if not replicas:
+            self.stdout.write("No read replicas configured; FAQ reads use the primary.")
+            return
+
+        for alias in replicas:
+            status = 'healthy' if replica_router.is_healthy(alias) else 'UNHEALTHY'
+            self.stdout.write(f"{alias}: {status}")
+
+        healthy = replica_router.healthy_replicas()
+        if healthy:
+            self.stdout.write(f"FAQ reads are served by: {', '.join(healthy)}")
+        else:
+            self.stderr.write("No healthy replica; FAQ reads have failed over to the primary.")
@@ -0,0 +1,78 @@
+# Import necessary modules for reporting the FAQ cache footprint
+import pickle  # Used to estimate what the legacy pickled list of dicts would cost
+from django.core.cache import cache  # Django caching framework holding the FAQ payloads
+from django.core.management.base import BaseCommand
+from api.caching import decode_faqs, faq_cache_key, ZLIB_TAG
+from api.models import Language
+
+CACHE_KEY_PREFIX = faq_cache_key('')  # Prefix shared by every cached FAQ list
+
+
+def redis_memory_usage(key):
+    """
+    Return the memory Redis reports for a cache key, or None when the cache
+    backend is not django-redis or the server cannot be reached.
+    """
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default').memory_usage(cache.make_key(key))
+    except Exception:
+        return None
+
+
+def cached_language_codes():
+    """
+    Return the language codes of every cached FAQ list, including codes that are not
+    Language rows (the view caches the English fallback under those too), or None
+    when the cache backend cannot enumerate keys.
+    """
+    if not hasattr(cache, 'iter_keys'):  # Only django-redis supports key enumeration
+        return None
+    return {key[len(CACHE_KEY_PREFIX):] for key in cache.iter_keys(CACHE_KEY_PREFIX + '*')}
+
+
+class Command(BaseCommand):
+    help = "Report the cached FAQ payload size for every language and the total cache footprint."
+
+    def handle(self, *args, **options):
+        lang_codes = ['en'] + [code for code in Language.objects.values_list('code', flat=True) if code != 'en']
+        cached_codes = cached_language_codes()
+        if cached_codes is not None:
+            lang_codes += sorted(cached_codes - set(lang_codes))
+
+        self.stdout.write(
+            f"{'lang':<8}{'faqs':>6}{'encoding':>10}{'payload B':>12}{'pickled B':>12}{'saved':>8}{'redis B':>10}"
+        )
+        total_payload = total_pickled = total_redis = cached = 0
+
+        for lang_code in lang_codes:
+            key = faq_cache_key(lang_code)
+            payload = cache.get(key)
+            if payload is None:
+                self.stdout.write(f"{lang_code:<8}{'-':>6}{'not cached':>10}")
+                continue
+
+            faqs = decode_faqs(payload)
+            legacy_size = len(pickle.dumps([dict(faq) for faq in faqs], pickle.HIGHEST_PROTOCOL))
+            if isinstance(payload, list):
+                encoding, size = 'legacy', legacy_size
+            else:
+                encoding, size = ('zlib' if payload[:1] == ZLIB_TAG else 'raw'), len(payload)
+            saved = 1 - size / legacy_size if legacy_size else 0.0
+            in_redis = redis_memory_usage(key)
+
+            self.stdout.write(
+                f"{lang_code:<8}{len(faqs):>6}{encoding:>10}{size:>12}{legacy_size:>12}{saved:>8.1%}"
+                f"{in_redis if in_redis is not None else '-':>10}"
+            )
+            cached += 1
+            total_payload += size
+            total_pickled += legacy_size
+            total_redis += in_redis or 0
+
+        scope = "" if cached_codes is not None else " (known languages only; this cache backend cannot list keys)"
+        self.stdout.write(
+            f"Total{scope}: {cached} of {len(lang_codes)} languages cached, {total_payload} payload bytes "
+            f"({total_pickled} as pickled dicts)"
+            + (f", {total_redis} bytes reported by Redis" if total_redis else "")
+        )
@@ -0,0 +1,250 @@
+# Import necessary modules for the load-generation command
+import math  # Used for nearest-rank percentile calculation
+import queue  # Work queue shared by the worker threads
+import random  # Generates the traffic mix
+import threading  # Worker pool for concurrent requests
+import time  # High resolution timers for latency measurement
+import urllib.error  # Error types raised by urllib for non-2xx responses
+import urllib.request  # HTTP client used against a running server
+
+from django.core.cache import cache  # Shared cache used to force cold requests
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections  # Closed per worker thread once it is done
+from django.test import Client  # In-process client used when no URL is given
+from api.caching import faq_cache_key  # Cache key naming shared with the FAQ list view
+from api.models import FAQ  # FAQs are re-saved to trigger cache invalidation
+
+# Upper bounds (in milliseconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, math.inf]
+
+
+def parse_language_mix(value):
+    """
+    Parse a language mix such as "en=60,hi=20,fr=20" into a list of
+    (language_code, weight) pairs.
+    """
+    mix = []
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        code, _, weight = part.partition('=')
+        try:
+            weight = float(weight) if weight else 1.0
+        except ValueError:
+            raise CommandError(f"Invalid weight in language mix: '{part}'")
+        if not code or weight < 0:
+            raise CommandError(f"Invalid entry in language mix: '{part}'")
+        mix.append((code.strip(), weight))
+
+    if not mix or sum(weight for _, weight in mix) <= 0:
+        raise CommandError("The language mix must contain at least one language with a positive weight")
+    return mix
+
+
+def percentile(sorted_values, pct):
+    """
+    Return the nearest-rank percentile of an already sorted list of values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def histogram(values):
+    """
+    Count the latencies (in milliseconds) falling into each histogram bucket.
+    """
+    counts = [0] * len(HISTOGRAM_BUCKETS_MS)
+    for value in values:
+        for index, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+            if value <= upper:
+                counts[index] += 1
+                break
+    return counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a configurable traffic mix against /api/faqs/ and report throughput "
+        "and latency percentiles, with separate histograms for cache hits and misses. "
+        "Without --url the requests go through an in-process test client; with --url they "
+        "are sent to a running server, which must share this process's cache and database "
+        "for --cold-ratio and --edit-ratio to have an effect."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default=None,
+                            help="Base URL of a running server (e.g. http://127.0.0.1:8000). "
+                                 "Defaults to an in-process test client.")
+        parser.add_argument('--requests', type=int, default=1000,
+                            help="Total number of operations to perform (default: 1000).")
+        parser.add_argument('--concurrency', type=int, default=10,
+                            help="Number of worker threads (default: 10).")
+        parser.add_argument('--mix', default='en=1',
+                            help="Weighted language distribution, e.g. 'en=60,hi=20,fr=20' (default: en=1).")
+        parser.add_argument('--cold-ratio', type=float, default=0.0,
+                            help="Fraction of reads preceded by deleting the language's cache key (default: 0).")
+        parser.add_argument('--edit-ratio', type=float, default=0.0,
+                            help="Fraction of operations that re-save a random FAQ, "
+                                 "invalidating the cache through FAQ.save (default: 0). Requires --allow-writes.")
+        parser.add_argument('--allow-writes', action='store_true',
+                            help="Allow --edit-ratio to modify the configured database. Every edit calls "
+                                 "Google Translate for each language and adds a Translation row per language.")
+        parser.add_argument('--seed', type=int, default=None,
+                            help="Random seed so that a traffic mix can be replayed exactly.")
+
+    def handle(self, *args, **options):
+        total = options['requests']
+        concurrency = options['concurrency']
+        cold_ratio = options['cold_ratio']
+        edit_ratio = options['edit_ratio']
+
+        if total <= 0 or concurrency <= 0:
+            raise CommandError("--requests and --concurrency must be positive")
+        if not 0 <= cold_ratio <= 1 or not 0 <= edit_ratio <= 1:
+            raise CommandError("--cold-ratio and --edit-ratio must be between 0 and 1")
+
+        if edit_ratio and not options['allow_writes']:
+            raise CommandError(
+                "--edit-ratio writes to the configured database (each edit adds a Translation row per "
+                "language and calls Google Translate); pass --allow-writes to confirm"
+            )
+
+        mix = parse_language_mix(options['mix'])
+        faq_ids = list(FAQ.objects.values_list('pk', flat=True)) if edit_ratio else []
+        if edit_ratio and not faq_ids:
+            raise CommandError("--edit-ratio requires at least one FAQ in the database")
+        if edit_ratio:
+            self.stderr.write(
+                "Warning: edits permanently add Translation rows to the configured database "
+                "and call Google Translate for every language."
+            )
+
+        # Build the whole operation plan up front so that the timed section only measures requests
+        rng = random.Random(options['seed'])
+        codes = [code for code, _ in mix]
+        weights = [weight for _, weight in mix]
+        work = queue.Queue()
+        for _ in range(total):
+            if rng.random() < edit_ratio:
+                work.put(('edit', rng.choice(faq_ids), False))
+            else:
+                work.put(('get', rng.choices(codes, weights)[0], rng.random() < cold_ratio))
+
+        results = []  # (kind, latency in ms) tuples
+        errors = []
+        lock = threading.Lock()
+        send = self._remote_sender(options['url']) if options['url'] else self._local_sender()
+
+        def worker():
+            try:
+                while True:
+                    try:
+                        op, target, cold = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        if op == 'edit':
+                            start = time.perf_counter()
+                            FAQ.objects.get(pk=target).save()
+                            kind = 'edit'
+                        else:
+                            if cold:
+                                cache.delete(faq_cache_key(target))
+                            start = time.perf_counter()
+                            status, cache_status = send(target)
+                            if status >= 400:
+                                raise RuntimeError(f"HTTP {status} for lang={target}")
+                            kind = (cache_status or 'unknown').lower()
+                        elapsed = (time.perf_counter() - start) * 1000
+                        with lock:
+                            results.append((kind, elapsed))
+                    except Exception as e:
+                        with lock:
+                            errors.append(str(e))
+            finally:
+                # Each thread opened its own database connection; release it
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.perf_counter() - started
+
+        self._report(results, errors, duration, concurrency)
+
+    def _local_sender(self):
+        """
+        Return a function performing a GET through a per-thread in-process test client.
+        """
+        local = threading.local()
+
+        def send(lang_code):
+            if not hasattr(local, 'client'):
+                local.client = Client(HTTP_HOST='localhost')
+            response = local.client.get('/api/faqs/', {'lang': lang_code})
+            return response.status_code, response.headers.get('X-Cache')
+
+        return send
+
+    def _remote_sender(self, base_url):
+        """
+        Return a function performing a GET against a running server.
+        """
+        endpoint = base_url.rstrip('/') + '/api/faqs/?lang='
+
+        def send(lang_code):
+            try:
+                with urllib.request.urlopen(endpoint + lang_code, timeout=30) as response:
+                    response.read()
+                    return response.status, response.headers.get('X-Cache')
+            except urllib.error.HTTPError as e:
+                return e.code, None
+
+        return send
+
+    def _report(self, results, errors, duration, concurrency):
+        """
+        Print read throughput, percentiles and per-kind latency histograms.
+        Edits are reported on their own row so that they do not skew the read figures.
+        """
+        reads = [latency for kind, latency in results if kind != 'edit']
+        edits = len(results) - len(reads)
+        throughput = len(reads) / duration if duration else 0.0
+        self.stdout.write(
+            f"Completed {len(reads)} reads and {edits} edits in {duration:.2f}s "
+            f"({throughput:.1f} reads/s, concurrency={concurrency}, errors={len(errors)})"
+        )
+        for message in sorted(set(errors))[:5]:
+            self.stderr.write(f"  error: {message}")
+
+        # 'reads' covers every GET; edits only appear on the 'edit' row
+        by_kind = {'reads': reads}
+        for kind, latency in results:
+            by_kind.setdefault(kind, []).append(latency)
+
+        self.stdout.write(f"{'kind':<8}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for kind, values in by_kind.items():
+            values.sort()
+            self.stdout.write(
+                f"{kind:<8}{len(values):>8}"
+                f"{percentile(values, 50):>10.2f}{percentile(values, 95):>10.2f}"
+                f"{percentile(values, 99):>10.2f}{(values[-1] if values else 0):>10.2f}"
+            )
+
+        for kind in ('hit', 'miss'):
+            values = by_kind.get(kind)
+            if not values:
+                continue
+            self.stdout.write(f"\nLatency histogram ({kind})")
+            counts = histogram(values)
+            widest = max(counts)
+            for upper, count in zip(HISTOGRAM_BUCKETS_MS, counts):
+                label = f"<= {upper:g} ms" if upper != math.inf else f"> {HISTOGRAM_BUCKETS_MS[-2]:g} ms"
+                bar = '#' * (round(40 * count / widest) if widest else 0)
+                self.stdout.write(f"  {label:>12} | {bar:<40} {count}")
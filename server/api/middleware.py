@@ -0,0 +1,40 @@
+from django.conf import settings
+from .routers import get_replica_router
+
+# Cookie telling any worker that this client wrote recently and must read from the primary
+PIN_COOKIE = 'faq_primary_pin'
+
+
+class FAQReplicaPinMiddleware:
+    """
+    Scope the FAQReplicaRouter read-your-writes pin to the client that wrote.
+
+    Each request starts unpinned, so a write made while serving one client never pins
+    other requests handled by the same worker thread. When a request writes, the response
+    sets a short-lived cookie, and requests carrying it are pinned to the primary whichever
+    process serves them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        replica_router = get_replica_router()
+        if replica_router is None:
+            return self.get_response(request)
+
+        replica_router.reset_thread_state()
+        if request.COOKIES.get(PIN_COOKIE):
+            replica_router.pin_to_primary()
+
+        try:
+            response = self.get_response(request)
+            if replica_router.has_written():
+                response.set_cookie(
+                    PIN_COOKIE, '1',
+                    max_age=getattr(settings, 'FAQ_REPLICA_PIN_SECONDS', 5),
+                    httponly=True, samesite='Lax',
+                )
+            return response
+        finally:
+            replica_router.reset_thread_state()
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FAQDocument',
+            fields=[
+                ('language_code', models.CharField(max_length=10, primary_key=True, serialize=False)),
+                ('payload', models.BinaryField()),
+                ('faq_ids', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
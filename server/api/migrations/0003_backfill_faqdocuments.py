@@ -0,0 +1,70 @@
+# Builds the materialized FAQ documents for FAQs and languages that existed before 0002
+
+import json
+import zlib
+
+from django.db import migrations
+from django.db.models import F
+
+
+def encode_rows(rows):
+    """
+    Encode FAQ rows the way api.caching.encode_faqs does, inlined so that later changes to
+    the cache encoding (which stays able to decode this one) cannot alter this migration.
+    """
+    columns = [[row[field] for row in rows] for field in ('question', 'answer')]
+    body = json.dumps(
+        {'fields': ('question', 'answer'), 'columns': columns},
+        separators=(',', ':'),
+        ensure_ascii=False,
+    ).encode('utf-8')
+    if len(body) >= 1024:
+        compressed = zlib.compress(body, 6)
+        if len(compressed) < len(body):
+            return b'z' + compressed
+    return b'j' + body
+
+
+def build_documents(apps, schema_editor):
+    """
+    Build the 'en' document and one document per Language from the FAQ and Translation
+    tables, using the first translation of each FAQ and falling back to English.
+    """
+    alias = schema_editor.connection.alias
+    FAQ = apps.get_model('api', 'FAQ')
+    FAQDocument = apps.get_model('api', 'FAQDocument')
+    Language = apps.get_model('api', 'Language')
+    Translation = apps.get_model('api', 'Translation')
+
+    faqs = list(FAQ.objects.using(alias).order_by('pk').values_list('pk', 'question', 'answer'))
+    languages = {'en': None}
+    languages.update(Language.objects.using(alias).exclude(code='en').values_list('code', 'pk'))
+
+    for code, language_id in languages.items():
+        translations = {}
+        if language_id is not None:
+            values = Translation.objects.using(alias).filter(language_id=language_id).order_by('pk')
+            for faq_id, question, answer in values.values_list('faq_id', 'question', 'answer'):
+                translations.setdefault(faq_id, (question, answer))  # Keep the first translation of each FAQ
+
+        faq_ids, rows = [], []
+        for faq_id, question, answer in faqs:
+            question, answer = translations.get(faq_id, (question, answer))
+            faq_ids.append(faq_id)
+            rows.append({'question': question, 'answer': answer})
+
+        values = {'payload': encode_rows(rows), 'faq_ids': faq_ids}
+        documents = FAQDocument.objects.using(alias)
+        if not documents.filter(pk=code).update(version=F('version') + 1, **values):
+            documents.create(language_code=code, **values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_faqdocument'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,14 @@
 # Import necessary modules
-from django.db import models  # Django's ORM for defining database models
+from bisect import bisect_left  # Locates an FAQ's position inside a materialized document
+from django.db import IntegrityError, models, router, transaction  # Django's ORM for defining database models
+from django.db.models import F  # Atomic version bumps for materialized documents
+from django.db.models.signals import post_delete  # Keeps materialized documents in sync with deletions
+from django.dispatch import receiver
 from ckeditor.fields import RichTextField  # Provides a rich text editor for formatted content
 from googletrans import Translator  # Google Translate API for automatic translations
 from django.core.cache import cache  # Django caching framework to store translation results
+from django.utils import timezone  # Sets updated_at on documents changed through queryset.update()
+from .caching import decode_faqs, encode_faqs, faq_cache_key  # Cache payload encoding shared with the FAQ list view
 
 # ---------------------------------------------
 # Language Model: Stores available languages for translations
@@ -22,19 +28,26 @@ class Language(models.Model):
         if is_new_language:  # If a new language is added, translate all existing FAQs
             translator = Translator()  # Initialize the Google Translate API
 
+            translations = []
             all_faqs = FAQ.objects.all()  # Retrieve all existing FAQs
             for faq in all_faqs:
                 # Translate question and answer from English to the newly added language
                 translated_question = translator.translate(faq.question, src='en', dest=self.code).text
                 translated_answer = translator.translate(faq.answer, src='en', dest=self.code).text
 
-                # Create and save the translated FAQ entry in the Translation model
-                Translation.objects.create(
+                # Collect the translated FAQ entry for the Translation model
+                translations.append(Translation(
                     faq=faq,
                     language=self,
                     question=translated_question,
                     answer=translated_answer
-                )
+                ))
+
+            # Insert all translations at once, then materialize the language's document in a single pass
+            # (bulk_create bypasses Translation.save, which would otherwise update the document once per FAQ)
+            Translation.objects.bulk_create(translations)
+            FAQDocument.rebuild(self.code, self)
+            cache.delete(faq_cache_key(self.code))
 
 # ---------------------------------------------
 # FAQ Model: Stores frequently asked questions in English
@@ -49,18 +62,19 @@ class FAQ(models.Model):
         Override the save method to translate the FAQ into all available languages 
         and update the cache to keep translations fresh.
         """
-        cache_key = "faq_translations_en"  # Cache key for storing English FAQs
-        cache.delete(cache_key)  # Clear cache to ensure updated FAQs are stored
         super().save(*args, **kwargs)  # Save the FAQ in the database
 
+        # Update the English document, then clear the cache so it is refilled from the fresh document
+        FAQDocument.upsert_row('en', self.pk, {'question': self.question, 'answer': self.answer})
+        cache.delete(faq_cache_key('en'))
+
         translator = Translator()  # Initialize Google Translate API
         all_languages = Language.objects.all()  # Retrieve all available languages
 
         # Iterate through all languages and create translations
         for lang in all_languages:
             if lang.code:
-                cache_key = f"faq_translations_{lang.code}"  # Cache key for each translated language
-                cache.delete(cache_key)  # Clear translation cache to refresh data
+                cache.delete(faq_cache_key(lang.code))  # Clear translation cache to refresh data
                 
                 # Translate question and answer from English to the target language
                 translated_question = translator.translate(self.question, src='en', dest=lang.code).text
@@ -87,3 +101,231 @@ class Translation(models.Model):
     question = models.TextField()  # Stores the translated question
     answer = RichTextField()  # Stores the translated answer (supports rich text formatting)
     created_at = models.DateTimeField(auto_now_add=True)  # Timestamp when the translation is created
+
+    def save(self, *args, **kwargs):
+        """
+        Override the save method to update the FAQ's row in the language's materialized
+        document and clear the language's cache.
+        """
+        super().save(*args, **kwargs)  # Save the translation in the database
+        FAQDocument.refresh_row(self.faq, self.language)
+        cache.delete(faq_cache_key(self.language.code))
+
+# Optimistic update attempts on a materialized document before falling back to a full rebuild
+UPDATE_ATTEMPTS = 5
+
+# ---------------------------------------------
+# FAQDocument Model: Materialized FAQ list for each language
+# ---------------------------------------------
+class FAQDocument(models.Model):
+    """
+    Holds the complete FAQ list of one language, already encoded the way it is cached
+    (see api.caching.encode_faqs), so that a cache miss costs a single primary-key read
+    instead of scanning and joining FAQ and Translation for the whole catalog.
+
+    The 'en' document holds the English FAQs. Other documents hold the first translation
+    of each FAQ in that language, falling back to English where none exists.
+    Documents are kept up to date row by row by the FAQ and Translation write paths,
+    using optimistic locking (see _update_rows) rather than row locks so that writers
+    never block the readers serving cache misses.
+    """
+    language_code = models.CharField(max_length=10, primary_key=True)  # 'en' or a Language code
+    payload = models.BinaryField()  # Encoded FAQ list, ready to be stored in the cache as is
+    faq_ids = models.JSONField(default=list)  # FAQ ids in the same order as the payload rows
+    updated_at = models.DateTimeField(auto_now=True)  # Timestamp of the last update
+    version = models.PositiveIntegerField(default=0)  # Bumped on every update for optimistic locking
+
+    @staticmethod
+    def build_rows(language=None, using=None):
+        """
+        Assemble the FAQ list of a language (English when language is None) from the
+        FAQ and Translation tables of the given database (the routed one by default).
+        Returns the FAQ ids and the matching rows.
+        """
+        translations = {}
+        if language is not None:
+            values = Translation.objects.db_manager(using).filter(language=language).order_by('pk').values_list('faq_id', 'question', 'answer')
+            for faq_id, question, answer in values:
+                translations.setdefault(faq_id, (question, answer))  # Keep the first translation of each FAQ
+
+        faq_ids, rows = [], []
+        for faq_id, question, answer in FAQ.objects.db_manager(using).order_by('pk').values_list('pk', 'question', 'answer'):
+            question, answer = translations.get(faq_id, (question, answer))
+            faq_ids.append(faq_id)
+            rows.append({'question': question, 'answer': answer})
+        return faq_ids, rows
+
+    @classmethod
+    def rebuild(cls, language_code, language=None):
+        """
+        Rebuild a language's document from scratch and return its payload. The FAQ and
+        Translation tables are scanned on the primary, never on a possibly lagging replica.
+
+        The document's version is read before the scan and the result is only written if no
+        other writer bumped it in between (see _update_rows); otherwise the scan is retried.
+        A document that keeps changing under us is finally rebuilt under a short row lock.
+        """
+        if language_code == 'en':
+            language = None  # The English document always holds the untranslated FAQs
+        alias = router.db_for_write(cls)
+        documents = cls.objects.using(alias)
+
+        def scan():
+            faq_ids, rows = cls.build_rows(language, using=alias)
+            payload = encode_faqs(rows)
+            return payload, {'payload': payload, 'faq_ids': faq_ids, 'updated_at': timezone.now()}
+
+        for _ in range(UPDATE_ATTEMPTS):
+            version = documents.filter(pk=language_code).values_list('version', flat=True).first()
+            payload, values = scan()
+            if version is None:
+                try:
+                    with transaction.atomic(using=alias):
+                        documents.create(language_code=language_code, **values)
+                    return payload
+                except IntegrityError:
+                    continue  # Another writer created the document meanwhile; rescan against it
+            if documents.filter(pk=language_code, version=version).update(version=version + 1, **values):
+                return payload
+
+        # Writers that change the document meanwhile wait for the lock and then retry on the new version
+        with transaction.atomic(using=alias):
+            exists = documents.select_for_update().filter(pk=language_code).values_list('version', flat=True).first() is not None
+            payload, values = scan()
+            if exists:
+                documents.filter(pk=language_code).update(version=F('version') + 1, **values)
+            else:
+                documents.create(language_code=language_code, **values)
+        return payload
+
+    @classmethod
+    def load_payload(cls, language_code, language=None, using=None):
+        """
+        Return the encoded FAQ list of a language, read from the given database (the routed
+        one by default). Without a document the list is assembled from the FAQ and Translation
+        tables but not stored, so that reads never write: documents are created by the write
+        paths and by `checkfaqdocuments --repair`.
+        """
+        payload = cls.objects.db_manager(using).filter(pk=language_code).values_list('payload', flat=True).first()
+        if payload is not None:
+            return bytes(payload)
+
+        if language_code == 'en':
+            language = None  # The English document always holds the untranslated FAQs
+        return encode_faqs(cls.build_rows(language, using)[1])
+
+    @classmethod
+    def _update_rows(cls, language_code, change, language=None, rebuild_missing=False):
+        """
+        Apply change(faq_ids, rows) to a language's document with optimistic locking.
+
+        The document is read without taking locks and written back with a single UPDATE
+        that only matches if no other writer bumped its version in between; otherwise the
+        change is retried on the newer document. change() edits the lists in place and
+        returns False when there is nothing to write. A document that is missing is rebuilt
+        when rebuild_missing is set, as is one that keeps changing under us.
+        """
+        documents = cls.objects.using(router.db_for_write(cls))
+        for _ in range(UPDATE_ATTEMPTS):
+            current = documents.filter(pk=language_code).values_list('faq_ids', 'payload', 'version').first()
+            if current is None:
+                if rebuild_missing:
+                    cls.rebuild(language_code, language)
+                return
+
+            faq_ids, payload, version = current
+            rows = decode_faqs(bytes(payload))
+            if not change(faq_ids, rows):
+                return
+
+            updated = documents.filter(pk=language_code, version=version).update(
+                faq_ids=faq_ids, payload=encode_faqs(rows), version=version + 1, updated_at=timezone.now()
+            )
+            if updated:
+                return
+
+        cls.rebuild(language_code, language)
+
+    @classmethod
+    def upsert_row(cls, language_code, faq_id, row, language=None):
+        """
+        Insert or replace a single FAQ's row in a language's document.
+        """
+        def change(faq_ids, rows):
+            index = bisect_left(faq_ids, faq_id)
+            if index < len(faq_ids) and faq_ids[index] == faq_id:
+                if rows[index] == row:
+                    return False  # Unchanged, skip the write
+                rows[index] = row
+            else:
+                faq_ids.insert(index, faq_id)
+                rows.insert(index, row)
+            return True
+
+        cls._update_rows(language_code, change, language, rebuild_missing=True)
+
+    @classmethod
+    def refresh_row(cls, faq, language):
+        """
+        Recompute a single FAQ's row in a language's document from its first translation,
+        falling back to the English FAQ.
+        """
+        translation = None
+        if language.code != 'en':  # The English document always holds the untranslated FAQs
+            translation = Translation.objects.filter(faq_id=faq.pk, language_id=language.pk).order_by('pk').first()
+        source = translation or faq
+        cls.upsert_row(language.code, faq.pk, {'question': source.question, 'answer': source.answer}, language)
+
+    @classmethod
+    def remove_faq(cls, faq_id):
+        """
+        Remove an FAQ's row from every document.
+        """
+        def change(faq_ids, rows):
+            if faq_id not in faq_ids:
+                return False
+            index = faq_ids.index(faq_id)
+            del faq_ids[index]
+            del rows[index]
+            return True
+
+        for language_code in cls.objects.using(router.db_for_write(cls)).values_list('language_code', flat=True):
+            cls._update_rows(language_code, change)
+
+
+def _deleted_with_parent(origin):
+    """
+    Return whether a delete was started from an FAQ or a Language (instance or queryset),
+    i.e. the deleted Translation goes away as part of that parent's cascade.
+    """
+    origin_model = getattr(origin, 'model', type(origin))
+    return isinstance(origin_model, type) and issubclass(origin_model, (FAQ, Language))
+
+
+# ---------------------------------------------
+# Keep materialized documents in sync with deletions (including admin bulk and cascade deletes)
+# ---------------------------------------------
+@receiver(post_delete, sender=FAQ)
+def remove_deleted_faq_from_documents(sender, instance, **kwargs):
+    FAQDocument.remove_faq(instance.pk)
+    cache.delete_many([faq_cache_key(code) for code in FAQDocument.objects.values_list('language_code', flat=True)])
+
+
+@receiver(post_delete, sender=Translation)
+def refresh_document_after_translation_delete(sender, instance, origin=None, **kwargs):
+    # When an FAQ or Language is deleted, its translations' post_delete fires first (the parent
+    # row still exists at that point). The parent's own handler removes the FAQ's rows or the
+    # language's document, so refreshing one row per translation here would only rewrite
+    # documents that are about to change again.
+    if _deleted_with_parent(origin):
+        return
+    faq = FAQ.objects.filter(pk=instance.faq_id).first()
+    if faq is not None:  # The FAQ is gone if it was deleted without going through the ORM
+        FAQDocument.refresh_row(faq, instance.language)
+        cache.delete(faq_cache_key(instance.language.code))
+
+
+@receiver(post_delete, sender=Language)
+def delete_document_of_deleted_language(sender, instance, **kwargs):
+    FAQDocument.objects.filter(pk=instance.code).delete()
+    cache.delete(faq_cache_key(instance.code))
@@ -0,0 +1,174 @@
+# Import necessary modules for routing FAQ reads to read replicas
+import random  # Spreads reads across the healthy replicas
+import threading  # Per-thread pinning state and a lock for the shared health cache
+import time  # Monotonic clock for pin windows and health check expiry
+from contextlib import contextmanager
+from django.conf import settings  # Replica aliases and timing configuration
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, router  # Connections used for health checks, installed routers
+
+# Models whose reads may be served by a replica (lower-case model names of the 'api' app)
+ROUTED_MODELS = {'faq', 'translation', 'language', 'faqdocument'}
+
+
+class FAQReplicaRouter:
+    """
+    Database router sending reads of the FAQ models to the read replicas listed in
+    settings.FAQ_READ_REPLICAS, while every write goes to the primary.
+
+    After a write, reads made by the same thread are pinned to the primary for
+    FAQ_REPLICA_PIN_SECONDS. FAQReplicaPinMiddleware scopes that pin to the request
+    and carries it to the client's next requests (served by any worker) in a cookie.
+    Cache refills served by a replica are cached for FAQ_REPLICA_CACHE_TTL seconds
+    only, so replica lag never ends up in a cached list that has no expiry.
+    Replicas are health-checked with a trivial query, the result is remembered for
+    FAQ_REPLICA_HEALTH_TTL seconds, and reads fail over to the primary when no
+    replica is healthy. A replica on which a query fails with an OperationalError is
+    marked unhealthy straight away instead of waiting for the next check.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()  # pinned_until, wrote and primary_depth of the current thread
+        self._health = {}  # Replica alias -> (is_healthy, monotonic time of the check)
+
+    def _is_routed(self, model):
+        return model._meta.app_label == 'api' and model._meta.model_name in ROUTED_MODELS
+
+    def pin_to_primary(self):
+        """
+        Send the current thread's reads to the primary for the read-your-writes window.
+        """
+        self._local.pinned_until = time.monotonic() + getattr(settings, 'FAQ_REPLICA_PIN_SECONDS', 5)
+
+    def reset_thread_state(self):
+        """
+        Forget the current thread's pin and write flag, e.g. at the start of a request.
+        """
+        self._local.pinned_until = 0.0
+        self._local.wrote = False
+
+    def has_written(self):
+        """
+        Return whether the current thread wrote a routed model since its state was last reset.
+        """
+        return getattr(self._local, 'wrote', False)
+
+    def is_pinned(self):
+        if getattr(self._local, 'primary_depth', 0):
+            return True
+        return time.monotonic() < getattr(self._local, 'pinned_until', 0.0)
+
+    @contextmanager
+    def primary_reads(self):
+        """
+        Serve every routed read made by the current thread inside the block from the primary.
+        """
+        self._local.primary_depth = getattr(self._local, 'primary_depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.primary_depth -= 1
+
+    def is_healthy(self, alias):
+        """
+        Return whether a replica answers a trivial query, reusing a recent result when available.
+        """
+        now = time.monotonic()
+        cached = self._health.get(alias)
+        if cached and now - cached[1] < getattr(settings, 'FAQ_REPLICA_HEALTH_TTL', 10):
+            return cached[0]
+
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute('SELECT 1')
+            healthy = True
+        except Exception:
+            healthy = False
+            # Drop the broken connection so that the next check reconnects from scratch
+            connections[alias].close()
+
+        with self._lock:
+            self._health[alias] = (healthy, now)
+        return healthy
+
+    def mark_unhealthy(self, alias):
+        """
+        Take a replica out of rotation until its next health check is due.
+        """
+        with self._lock:
+            self._health[alias] = (False, time.monotonic())
+
+    def _watch_failures(self, execute, sql, params, many, context):
+        """
+        Execute wrapper installed on replica connections: a failing query marks the replica unhealthy.
+        """
+        try:
+            return execute(sql, params, many, context)
+        except OperationalError:
+            self.mark_unhealthy(context['connection'].alias)
+            raise
+
+    def healthy_replicas(self):
+        return [alias for alias in getattr(settings, 'FAQ_READ_REPLICAS', []) if self.is_healthy(alias)]
+
+    def db_for_read(self, model, **hints):
+        if not self._is_routed(model):
+            return None
+        if self.is_pinned():
+            return DEFAULT_DB_ALIAS
+
+        replicas = self.healthy_replicas()
+        if not replicas:
+            # Fail over to the primary when every replica is down (or none is configured)
+            return DEFAULT_DB_ALIAS
+
+        alias = random.choice(replicas)
+        wrappers = connections[alias].execute_wrappers  # Per-thread connection, so check every time
+        if self._watch_failures not in wrappers:
+            wrappers.append(self._watch_failures)
+        return alias
+
+    def db_for_write(self, model, **hints):
+        if not self._is_routed(model):
+            return None
+        self._local.wrote = True
+        self.pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The primary and its replicas hold the same data, so relations are always valid
+        if self._is_routed(type(obj1)) and self._is_routed(type(obj2)):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+def get_replica_router():
+    """
+    Return the installed FAQReplicaRouter, or None when it is not in DATABASE_ROUTERS.
+    """
+    return next((r for r in router.routers if isinstance(r, FAQReplicaRouter)), None)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read the FAQ models from the primary inside the block (a no-op without FAQReplicaRouter).
+    """
+    replica_router = get_replica_router()
+    if replica_router is None:
+        yield
+        return
+    with replica_router.primary_reads():
+        yield
+
+
+def mark_replica_unhealthy(alias):
+    """
+    Take a replica out of rotation after a failure (a no-op without FAQReplicaRouter).
+    """
+    replica_router = get_replica_router()
+    if replica_router is not None and alias != DEFAULT_DB_ALIAS:
+        replica_router.mark_unhealthy(alias)
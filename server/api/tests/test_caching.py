@@ -0,0 +1,85 @@
+import pytest
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from api.caching import decode_faqs, encode_faqs, set_cached_faqs, RAW_TAG, ZLIB_TAG
+from api.models import FAQ
+
+
+def test_small_payload_is_stored_uncompressed(settings):
+    """
+    Test that payloads below the threshold round-trip without compression.
+    """
+    settings.FAQ_CACHE_COMPRESS_MIN_BYTES = 1024
+    faqs = [{'question': "What is Django?", 'answer': "Django is a web framework."}]
+
+    payload = encode_faqs(faqs)
+
+    assert payload[:1] == RAW_TAG
+    assert decode_faqs(payload) == faqs
+
+
+def test_large_payload_is_compressed(settings):
+    """
+    Test that payloads above the threshold are zlib-compressed and round-trip intact.
+    """
+    settings.FAQ_CACHE_COMPRESS_MIN_BYTES = 1024
+    faqs = [{'question': f"Question {i}?", 'answer': "<p>Same answer text.</p>" * 20} for i in range(50)]
+
+    payload = encode_faqs(faqs)
+
+    assert payload[:1] == ZLIB_TAG
+    assert decode_faqs(payload) == faqs
+
+
+def test_legacy_cached_list_is_returned_unchanged():
+    """
+    Test that lists cached before the compact encoding are still readable.
+    """
+    faqs = [{'question': "Q", 'answer': "A"}]
+    assert decode_faqs(faqs) is faqs
+
+
+@pytest.mark.django_db
+def test_view_caches_compact_payload():
+    """
+    Test that the FAQ list view stores the compact encoding and serves it on the next request.
+    """
+    client = APIClient()
+    FAQ.objects.create(question="What is Django?", answer="Django is a Python web framework.")
+    cache.clear()
+
+    assert client.get("/api/faqs/").headers['X-Cache'] == 'MISS'
+    assert isinstance(cache.get("faq_translations_en"), bytes)
+
+    response = client.get("/api/faqs/")
+    assert response.headers['X-Cache'] == 'HIT'
+    assert response.data == [{'question': "What is Django?", 'answer': "Django is a Python web framework."}]
+
+    out = StringIO()
+    call_command("faqcachestats", stdout=out)
+    assert "1 of 1 languages cached" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_faqcachestats_counts_keys_of_unknown_languages(monkeypatch):
+    """
+    Test that cached fallbacks for codes that are not Language rows are included in the total
+    when the cache backend can enumerate keys.
+    """
+    cache.clear()
+    set_cached_faqs('en', [{'question': "Q", 'answer': "A"}])
+    set_cached_faqs('xyz', [{'question': "Q", 'answer': "A"}])
+    monkeypatch.setattr(
+        cache, 'iter_keys',
+        lambda pattern: iter(["faq_translations_en", "faq_translations_xyz"]),
+        raising=False,
+    )
+
+    out = StringIO()
+    call_command("faqcachestats", stdout=out)
+    output = out.getvalue()
+
+    assert "\nxyz " in output
+    assert "Total: 2 of 2 languages cached" in output
@@ -0,0 +1,189 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch  # Mock Google Translate so the tests stay offline
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from rest_framework.test import APIClient
+from api.caching import decode_faqs
+from api.models import FAQ, FAQDocument, Language, Translation
+
+
+@pytest.fixture
+def translator():
+    """
+    Replace Google Translate with a fake that prefixes the text with the target language.
+    """
+    with patch("api.models.Translator") as mock_translator:
+        mock_translator.return_value.translate.side_effect = (
+            lambda text, src, dest: type("Translated", (), {"text": f"[{dest}] {text}"})()
+        )
+        yield mock_translator
+
+
+def document_rows(code):
+    return decode_faqs(bytes(FAQDocument.objects.get(pk=code).payload))
+
+
+@pytest.mark.django_db
+def test_documents_follow_faq_and_translation_writes(translator):
+    """
+    Test that the English and translated documents are updated by every write path.
+    """
+    first = FAQ.objects.create(question="What is Django?", answer="A web framework.")
+    Language.objects.create(code="fr")
+    second = FAQ.objects.create(question="What is Python?", answer="A language.")
+
+    assert document_rows("en") == [
+        {'question': "What is Django?", 'answer': "A web framework."},
+        {'question': "What is Python?", 'answer': "A language."},
+    ]
+    assert document_rows("fr") == [
+        {'question': "[fr] What is Django?", 'answer': "[fr] A web framework."},
+        {'question': "[fr] What is Python?", 'answer': "[fr] A language."},
+    ]
+
+    # Editing a translation updates its row in place
+    translation = Translation.objects.get(faq=second)
+    translation.question = "Qu'est-ce que Python ?"
+    translation.save()
+    assert document_rows("fr")[1]['question'] == "Qu'est-ce que Python ?"
+
+    # Deleting an FAQ removes it from every document
+    first.delete()
+    assert FAQDocument.objects.get(pk="en").faq_ids == [second.pk]
+    assert FAQDocument.objects.get(pk="fr").faq_ids == [second.pk]
+
+
+@pytest.mark.django_db
+def test_cache_miss_is_served_from_document(translator, django_assert_num_queries):
+    """
+    Test that a cold cache is refilled from the language's document without scanning the catalog.
+    """
+    client = APIClient()
+    for i in range(5):
+        FAQ.objects.create(question=f"Question {i}?", answer=f"Answer {i}.")
+    Language.objects.create(code="hi")
+    cache.clear()
+
+    # One query for the Language lookup and one primary-key read of the document
+    with django_assert_num_queries(2):
+        response = client.get("/api/faqs/?lang=hi")
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.data[0] == {'question': "[hi] Question 0?", 'answer': "[hi] Answer 0."}
+    assert cache.get("faq_translations_hi") == bytes(FAQDocument.objects.get(pk="hi").payload)
+
+
+@pytest.mark.django_db
+def test_checkfaqdocuments_detects_and_repairs_stale_documents(translator):
+    """
+    Test that the consistency checker reports documents changed behind its back and repairs them.
+    """
+    faq = FAQ.objects.create(question="What is Django?", answer="A web framework.")
+
+    # queryset.update() bypasses FAQ.save, leaving the English document stale
+    FAQ.objects.filter(pk=faq.pk).update(question="What is Django REST framework?")
+
+    with pytest.raises(CommandError):
+        call_command("checkfaqdocuments", stdout=StringIO())
+
+    out = StringIO()
+    call_command("checkfaqdocuments", repair=True, stdout=out)
+    assert "en: stale, rebuilt" in out.getvalue()
+    assert document_rows("en")[0]['question'] == "What is Django REST framework?"
+
+    out = StringIO()
+    call_command("checkfaqdocuments", stdout=out)
+    assert "en: ok (1 FAQs)" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_cache_miss_without_document_does_not_write(translator):
+    """
+    Test that a missing document is assembled for the response but only created by the write paths.
+    """
+    client = APIClient()
+    FAQ.objects.create(question="What is Django?", answer="A web framework.")
+    FAQDocument.objects.all().delete()
+    cache.clear()
+
+    response = client.get("/api/faqs/")
+
+    assert response.data == [{'question': "What is Django?", 'answer': "A web framework."}]
+    assert not FAQDocument.objects.exists()
+
+
+@pytest.mark.django_db
+def test_cascade_deletes_do_not_refresh_rows_one_by_one(translator, django_assert_max_num_queries):
+    """
+    Test that deleting a Language or an FAQ does not rewrite documents once per cascaded Translation.
+    """
+    Language.objects.create(code="fr")
+    Language.objects.create(code="de")
+    faqs = [FAQ.objects.create(question=f"Question {i}?", answer=f"Answer {i}.") for i in range(20)]
+
+    # Collect + delete translations and the language, drop its document: independent of the FAQ count
+    with django_assert_max_num_queries(10):
+        Language.objects.get(code="fr").delete()
+    assert not FAQDocument.objects.filter(pk="fr").exists()
+
+    # One optimistic update per remaining document, not one per translation
+    with django_assert_max_num_queries(15):
+        faqs[0].delete()
+    assert faqs[0].pk not in FAQDocument.objects.get(pk="de").faq_ids
+    assert faqs[0].pk not in FAQDocument.objects.get(pk="en").faq_ids
+
+
+@pytest.mark.django_db
+def test_rebuild_rescans_when_a_writer_updates_the_document_meanwhile(translator):
+    """
+    Test that a rebuild racing another writer does not overwrite the writer's change with its older scan.
+    """
+    FAQ.objects.create(question="What is Django?", answer="A web framework.")
+    build_rows = FAQDocument.build_rows
+    scans = []
+
+    def racing_build_rows(language=None, using=None):
+        result = build_rows(language, using)
+        if not scans:
+            # An FAQ saved after the scan bumps the document version before the rebuild writes
+            FAQ.objects.create(question="What is Python?", answer="A language.")
+        scans.append(result)
+        return result
+
+    with patch.object(FAQDocument, "build_rows", side_effect=racing_build_rows):
+        FAQDocument.rebuild("en")
+
+    assert len(scans) == 2
+    assert [row['question'] for row in document_rows("en")] == ["What is Django?", "What is Python?"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_migration_backfills_documents_for_existing_data():
+    """
+    Test that migrating a database holding FAQs and translations builds their documents.
+    """
+    executor = MigrationExecutor(connection)
+    executor.migrate([("api", "0001_initial")])
+    apps = executor.loader.project_state([("api", "0001_initial")]).apps
+    faq = apps.get_model("api", "FAQ").objects.create(question="What is Django?", answer="A web framework.")
+    apps.get_model("api", "FAQ").objects.create(question="What is Python?", answer="A language.")
+    language = apps.get_model("api", "Language").objects.create(code="fr")
+    apps.get_model("api", "Translation").objects.create(
+        faq=faq, language=language, question="Qu'est-ce que Django ?", answer="Un framework web."
+    )
+
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+    assert document_rows("en") == [
+        {'question': "What is Django?", 'answer': "A web framework."},
+        {'question': "What is Python?", 'answer': "A language."},
+    ]
+    assert document_rows("fr") == [
+        {'question': "Qu'est-ce que Django ?", 'answer': "Un framework web."},
+        {'question': "What is Python?", 'answer': "A language."},
+    ]
@@ -0,0 +1,70 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch  # Mock Google Translate so the load test stays offline
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from api.models import FAQ, Language
+from api.management.commands.loadtest import parse_language_mix, percentile
+
+
+def test_percentile_uses_nearest_rank():
+    """
+    Test that percentiles are computed with the nearest-rank method.
+    """
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+
+
+def test_parse_language_mix_rejects_invalid_weights():
+    """
+    Test that the language mix is parsed into weighted pairs and bad input is rejected.
+    """
+    assert parse_language_mix("en=60, fr=40") == [("en", 60.0), ("fr", 40.0)]
+    with pytest.raises(CommandError):
+        parse_language_mix("en=abc")
+    with pytest.raises(CommandError):
+        parse_language_mix("en=0")
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("api.models.Translator")
+def test_loadtest_reports_hits_and_misses(mock_translator):
+    """
+    Test that the load test replays a mixed workload in-process and reports
+    percentiles along with separate hit and miss histograms.
+    """
+    mock_translator.return_value.translate.return_value.text = "translated"
+
+    Language.objects.create(code="fr")
+    for i in range(3):
+        FAQ.objects.create(question=f"Question {i}?", answer=f"Answer {i}.")
+    cache.clear()
+
+    out = StringIO()
+    call_command(
+        "loadtest", requests=40, concurrency=2, mix="en=1,fr=1",
+        cold_ratio=0.25, edit_ratio=0.1, allow_writes=True, seed=1, stdout=out, stderr=StringIO(),
+    )
+    output = out.getvalue()
+
+    reads_line = next(line for line in output.splitlines() if line.startswith("reads"))
+    edit_line = next(line for line in output.splitlines() if line.startswith("edit"))
+    assert int(reads_line.split()[1]) + int(edit_line.split()[1]) == 40
+    assert "reads/s" in output
+    assert "errors=0" in output
+    assert "p95 ms" in output
+    assert "Latency histogram (hit)" in output
+    assert "Latency histogram (miss)" in output
+
+
+@pytest.mark.django_db
+def test_loadtest_edits_require_opt_in():
+    """
+    Test that edits, which write to the configured database, need --allow-writes.
+    """
+    with pytest.raises(CommandError, match="--allow-writes"):
+        call_command("loadtest", requests=1, edit_ratio=0.5, stdout=StringIO())
@@ -0,0 +1,230 @@
+import threading
+import time
+import pytest
+from unittest.mock import patch  # Mock Google Translate so the tests stay offline
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from api.caching import decode_faqs
+from api.middleware import FAQReplicaPinMiddleware, PIN_COOKIE
+from api.models import FAQ, FAQDocument, Language
+from api.routers import FAQReplicaRouter, get_replica_router, primary_reads
+from api.views import load_document
+
+
+@pytest.fixture
+def replica_router(settings):
+    """
+    Enable the 'replica' SQLite database for FAQ reads and return the installed
+    router with a clean pin window and health cache.
+    """
+    settings.FAQ_READ_REPLICAS = ['replica']
+    installed = get_replica_router()
+    installed.reset_thread_state()
+    installed._health.clear()
+    yield installed
+    installed.reset_thread_state()
+    installed._health.clear()
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_reads_use_primary_after_write_then_replica(replica_router):
+    """
+    Test that reads right after a write are served by the primary, and go to the
+    replica once the read-your-writes window has passed.
+    """
+    FAQ.objects.create(question="What is Django?", answer="Django is a web framework.")
+
+    # Pinned to the primary, so the new FAQ is visible
+    assert router.db_for_read(FAQ) == 'default'
+    assert FAQ.objects.count() == 1
+
+    # Once the window is over, reads go to the replica (which has not received the row)
+    replica_router.reset_thread_state()
+    assert router.db_for_read(FAQ) == 'replica'
+    assert FAQ.objects.count() == 0
+
+    # primary_reads() sends reads to the primary regardless of the pin
+    with primary_reads():
+        assert FAQ.objects.count() == 1
+
+    # Writes always go to the primary
+    assert router.db_for_write(Language) == 'default'
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_reads_fail_over_to_primary_when_replica_is_down(replica_router, monkeypatch):
+    """
+    Test that an unreachable replica is reported unhealthy and reads fall back to the primary.
+    """
+    def refuse_connection():
+        raise ConnectionError("replica is down")
+
+    monkeypatch.setattr(connections['replica'], 'ensure_connection', refuse_connection)
+
+    assert replica_router.is_healthy('replica') is False
+    assert router.db_for_read(FAQ) == 'default'
+
+
+def test_unrelated_models_are_not_routed(settings):
+    """
+    Test that models outside the FAQ read path are left to Django's default routing.
+    """
+    from django.contrib.auth.models import User
+
+    settings.FAQ_READ_REPLICAS = ['replica']
+    assert FAQReplicaRouter().db_for_read(User) is None
+    assert FAQReplicaRouter().db_for_write(User) is None
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_pin_is_scoped_to_the_writing_thread(replica_router):
+    """
+    Test that a write made by another thread does not pin this thread's reads.
+    """
+    writer = threading.Thread(target=lambda: router.db_for_write(FAQ))
+    writer.start()
+    writer.join()
+
+    assert router.db_for_read(FAQ) == 'replica'
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_middleware_pins_the_writing_client_with_a_cookie(replica_router):
+    """
+    Test that a request that writes sets the pin cookie, that requests carrying the
+    cookie read from the primary, and that other requests are not pinned.
+    """
+    factory = RequestFactory()
+    seen = {}
+
+    def write_view(request):
+        router.db_for_write(FAQ)
+        return HttpResponse()
+
+    def read_view(request):
+        seen['alias'] = router.db_for_read(FAQ)
+        return HttpResponse()
+
+    response = FAQReplicaPinMiddleware(write_view)(factory.post("/admin/"))
+    assert PIN_COOKIE in response.cookies
+
+    # The pin does not leak into the next request served by this thread
+    FAQReplicaPinMiddleware(read_view)(factory.get("/api/faqs/"))
+    assert seen['alias'] == 'replica'
+
+    # The writing client is pinned through its cookie, whichever worker serves it
+    request = factory.get("/api/faqs/")
+    request.COOKIES[PIN_COOKIE] = '1'
+    FAQReplicaPinMiddleware(read_view)(request)
+    assert seen['alias'] == 'default'
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_language_missing_from_replica_is_found_on_primary(replica_router):
+    """
+    Test that a language the replica has not received yet is looked up on the primary
+    instead of being treated as invalid and served the English list.
+    """
+    with patch("api.models.Translator") as mock_translator:
+        mock_translator.return_value.translate.side_effect = (
+            lambda text, src, dest: type("Translated", (), {"text": f"[{dest}] {text}"})()
+        )
+        FAQ.objects.create(question="What is Django?", answer="A web framework.")
+        Language.objects.create(code="fr")
+    replica_router.reset_thread_state()
+    cache.clear()
+
+    with patch("api.views.Translator") as view_translator:
+        view_translator.return_value.translate.side_effect = RuntimeError("offline")
+        response = APIClient().get("/api/faqs/?lang=fr")
+
+    assert response.data == [{'question': "[fr] What is Django?", 'answer': "[fr] A web framework."}]
+    assert not view_translator.called
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_refills_from_replica_expire_and_refills_from_primary_do_not(replica_router, settings):
+    """
+    Test that a cache refill served by a replica is cached with a bounded TTL, while one
+    served by the primary (here because the client is pinned) is cached without expiry.
+    """
+    settings.FAQ_REPLICA_CACHE_TTL = 7
+    FAQ.objects.create(question="What is Django?", answer="A web framework.")
+
+    # Pinned by the write: the refill comes from the primary
+    payload, timeout = load_document('en')
+    assert timeout is None
+    assert payload == bytes(FAQDocument.objects.using('default').get(pk='en').payload)
+
+    # Unpinned: the refill comes from the replica, which has not received the FAQ yet
+    replica_router.reset_thread_state()
+    cache.clear()
+    with patch("api.views.set_cached_payload") as set_cached_payload:
+        response = APIClient().get("/api/faqs/")
+
+    assert response.data == []
+    set_cached_payload.assert_called_once_with('en', load_document('en')[0], 7)
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_replica_failing_between_health_checks_is_taken_out_of_rotation(replica_router, monkeypatch):
+    """
+    Test that a replica failing a query after a successful health check is marked unhealthy
+    right away, and that the failed cache refill is served by the primary.
+    """
+    FAQ.objects.create(question="What is Django?", answer="A web framework.")
+    replica_router.reset_thread_state()
+    replica_router._health['replica'] = (True, time.monotonic())  # Healthy at the last check
+    cache.clear()
+
+    def refuse_connection():
+        raise OperationalError("replica is down")
+
+    monkeypatch.setattr(connections['replica'], 'ensure_connection', refuse_connection)
+
+    response = APIClient().get("/api/faqs/")
+
+    assert response.data == [{'question': "What is Django?", 'answer': "A web framework."}]
+    assert replica_router.is_healthy('replica') is False
+    assert router.db_for_read(FAQ) == 'default'
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_failing_query_on_replica_marks_it_unhealthy(replica_router):
+    """
+    Test that replica connections carry the failure watcher, which marks the replica
+    unhealthy when a routed query fails on it.
+    """
+    assert router.db_for_read(FAQ) == 'replica'
+    assert replica_router._watch_failures in connections['replica'].execute_wrappers
+
+    def failing_execute(sql, params, many, context):
+        raise OperationalError("server closed the connection unexpectedly")
+
+    with pytest.raises(OperationalError):
+        replica_router._watch_failures(failing_execute, "SELECT 1", None, False, {'connection': connections['replica']})
+    assert replica_router.is_healthy('replica') is False
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_document_repairs_never_store_replica_data(replica_router):
+    """
+    Test that checkfaqdocuments and FAQDocument.rebuild scan the primary, so a lagging
+    replica cannot overwrite the primary's documents.
+    """
+    FAQ.objects.create(question="What is Django?", answer="A web framework.")
+    expected = [{'question': "What is Django?", 'answer': "A web framework."}]
+    replica_router.reset_thread_state()
+
+    out = StringIO()
+    call_command("checkfaqdocuments", repair=True, stdout=out)
+    assert "en: ok (1 FAQs)" in out.getvalue()
+
+    replica_router.reset_thread_state()
+    FAQDocument.rebuild('en')
+    assert decode_faqs(bytes(FAQDocument.objects.using('default').get(pk='en').payload)) == expected
@@ -1,9 +1,28 @@
+from django.conf import settings  # Cache lifetime of refills served by a replica
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, IntegrityError, router  # Database serving a refill; failures
 from rest_framework.views import APIView
-from django.core.cache import cache
+from .caching import decode_faqs, get_cached_faqs, set_cached_payload  # Compact, compressed FAQ cache payloads
 from rest_framework.response import Response
 from googletrans import Translator  # For translation using Google Translate
-from .models import FAQ, Translation, Language  # Import models for FAQ, Translation, and Language
-from .serializers import FAQSerializer, TranslatedFAQSerializer  # Import serializers for FAQ and Translated FAQ
+from .models import FAQDocument, Language  # Import models for materialized FAQ documents and Language
+from .routers import mark_replica_unhealthy, primary_reads  # Replica failover; lookups that must not miss recent rows
+
+
+def load_document(document_code, language=None, from_primary=False):
+    """
+    Read a language's encoded FAQ list for a cache refill and return it with its cache timeout.
+    A payload served by a replica may lag behind the primary, so it is only cached for
+    FAQ_REPLICA_CACHE_TTL seconds; one served by the primary is cached without expiry.
+    A replica that fails the read is taken out of rotation and the primary serves the refill.
+    """
+    alias = DEFAULT_DB_ALIAS if from_primary else router.db_for_read(FAQDocument)
+    if alias != DEFAULT_DB_ALIAS:
+        try:
+            return FAQDocument.load_payload(document_code, language, using=alias), settings.FAQ_REPLICA_CACHE_TTL
+        except DatabaseError:
+            mark_replica_unhealthy(alias)
+    return FAQDocument.load_payload(document_code, language, using=DEFAULT_DB_ALIAS), None
+
 
 class FAQListView(APIView):
     def get(self, request, *args, **kwargs):
@@ -12,12 +31,19 @@ class FAQListView(APIView):
         # - If the 'lang' parameter is 'en' or not provided:
         #   1. The response will contain the list of FAQs in English.
         #   2. The FAQ data will be returned from cache if it has been cached previously.
-        #   3. If FAQs are not cached, they will be retrieved from the database, serialized, cached, and returned.
+        #   3. If FAQs are not cached, the pre-serialized English document is read from a replica (or the primary), cached, and returned.
         #   
         # - If a different 'lang' parameter is provided (e.g., 'fr' for French):
         #   1. The response will contain the list of FAQs translated into the specified language (if a translation exists).
         #   2. If the translation for a specific FAQ doesn't exist, the original FAQ (in English) will be returned.
-        #   3. Translated FAQs will be cached for future use."""
+        #   3. Translated FAQs will be cached for future use. On a cache miss they are read from the
+        #      language's materialized FAQDocument with a single primary-key lookup.
+        #
+        # - Lists read from a replica are cached for FAQ_REPLICA_CACHE_TTL seconds only, so that replica
+        #   lag cannot outlive that window; lists read from the primary are cached without expiry.
+        #
+        # - Every response carries an `X-Cache` header set to 'HIT' or 'MISS' so that
+        #   load tests and monitoring can tell cached responses apart from rebuilt ones."""
 
 
 
@@ -26,26 +52,30 @@ class FAQListView(APIView):
         
         # Case 1: If the requested language is 'en' or no language is provided, fetch English FAQs
         if lang_code == 'en' or not lang_code:
-            cache_key = "faq_translations_en"  # Define a unique cache key for English FAQs
-            cached_faqs = cache.get(cache_key)  # Try to get cached FAQs from cache
+            cached_faqs = get_cached_faqs('en')  # Try to get cached English FAQs from cache
             if cached_faqs:
                 # If cached data is found, return it directly as a response
-                return Response(cached_faqs)
+                return Response(cached_faqs, headers={'X-Cache': 'HIT'})
             
-            # If no cached data is found, retrieve all FAQs from the database
-            faqs = FAQ.objects.all()
-            # Serialize the FAQs using the FAQSerializer
-            serializer = FAQSerializer(faqs, many=True)
-            # Cache the serialized FAQ data for future requests
-            cache.set(cache_key, serializer.data, timeout=None)  
-            # Return the serialized FAQ data as a response
-            return Response(serializer.data)
+            # If no cached data is found, read the pre-serialized English document
+            payload, timeout = load_document('en')
+            # Cache the payload as is for future requests
+            set_cached_payload('en', payload, timeout)
+            # Return the FAQ data as a response
+            return Response(decode_faqs(payload), headers={'X-Cache': 'MISS'})
         
         # Case 2: If the requested language is not 'en', handle language-specific FAQs
+        replica_lagging = False
         try:
             # Try to fetch the Language object for the requested lang_code from the database
             language = Language.objects.get(code=lang_code)
         except Language.DoesNotExist:
+            # A replica may not have received a recently added language yet, so check the primary
+            replica_lagging = True
+            with primary_reads():
+                language = Language.objects.filter(code=lang_code).first()
+
+        if language is None:
             # If the language is not found in the database, attempt to create it
             translator = Translator()
             try:
@@ -53,47 +83,30 @@ class FAQListView(APIView):
                 translator.translate('Test', src='en', dest=lang_code)
                 # If successful, create a new Language object in the database
                 language = Language.objects.create(code=lang_code)
+            except IntegrityError:
+                # Another request created the language meanwhile: it is valid, use that one
+                with primary_reads():
+                    language = Language.objects.get(code=lang_code)
             except Exception as e:
                 # If the translation fails or there is another issue, set language to None
                 language = None  
 
-        # Define a unique cache key based on the requested language for storing translated FAQs
-        cache_key = f"faq_translations_{lang_code}"
         # Check if translations for the requested language are already cached
-        cached_translations = cache.get(cache_key)
+        cached_translations = get_cached_faqs(lang_code)
 
         if cached_translations:
             # If cached translations are found, return them as a response
-            return Response(cached_translations)
-
-        # If no cached translations are found, retrieve all FAQs from the database
-        faqs = FAQ.objects.all()
-        translated_faqs = []  # Initialize an empty list to store translated FAQs
-
-        # Iterate through each FAQ to check if a translation exists for the requested language
-        for faq in faqs:
-            translation = None
-            if language:
-                # If a language object exists, try to fetch the translation for the FAQ in that language
-                translation = Translation.objects.filter(faq=faq, language=language).first()
+            return Response(cached_translations, headers={'X-Cache': 'HIT'})
 
-            if translation:
-                # If a translation exists, append the translated question and answer to the list
-                translated_faqs.append({
-                    'question': translation.question,
-                    'answer': translation.answer,
-                })
-            else:
-                # If no translation exists, append the original FAQ (in English) to the list
-                translated_faqs.append({
-                    'question': faq.question,
-                    'answer': faq.answer,
-                })
+        # If no cached translations are found, read the language's pre-serialized document, from the
+        # primary when the replica lacked the language itself. Unknown languages fall back to the English document.
+        if language:
+            payload, timeout = load_document(lang_code, language, from_primary=replica_lagging)
+        else:
+            payload, timeout = load_document('en')
 
-        # Cache the translated FAQs for future requests to avoid redundant database queries
-        cache.set(cache_key, translated_faqs, timeout=None)
+        # Cache the payload as is for future requests to avoid redundant database queries
+        set_cached_payload(lang_code, payload, timeout)
 
-        # Serialize the translated FAQ data (or fallback to the original FAQ) using the TranslatedFAQSerializer
-        serializer = TranslatedFAQSerializer(translated_faqs, many=True)
-        # Return the serialized data as a response
-        return Response(serializer.data)
+        # Return the translated FAQ data (or the English fallback) as a response
+        return Response(decode_faqs(payload), headers={'X-Cache': 'MISS'})
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 import sys
 import os
+import tempfile
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -55,6 +56,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.FAQReplicaPinMiddleware',  # Scopes replica read-your-writes pinning to the writing client
 ]
 
 ROOT_URLCONF = 'server.urls'
@@ -87,8 +89,18 @@ if "pytest" in sys.modules:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",  # Use SQLite as the database engine
             "NAME": ":memory:",  # Use an in-memory database (temporary, faster for testing)
-        }
+            # The test database is a temporary file: concurrent tests (e.g. loadtest's worker threads)
+            # then wait on SQLite's busy timeout, whereas the shared in-memory database fails
+            # immediately with "database table is locked"
+            "TEST": {"NAME": os.path.join(tempfile.gettempdir(), f"faq_test_{os.getpid()}.sqlite3")},
+        },
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",  # Second SQLite database standing in for a read replica
+            "NAME": ":memory:",
+        },
     }
+    # Tests opt into replica reads by overriding this setting
+    FAQ_READ_REPLICAS = []
 else:
     DATABASES = {
     'default': {
@@ -101,6 +113,26 @@ else:
     }
 }
 
+    # Optional read replicas for the FAQ read path, e.g. DB_REPLICA_HOSTS=replica1.internal,replica2.internal
+    FAQ_READ_REPLICAS = []
+    for index, host in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1):
+        DATABASES[f'replica_{index}'] = {
+            **DATABASES['default'],
+            'HOST': host.strip(),
+            # Fail fast so that an unreachable replica cannot stall the request running its health check
+            'OPTIONS': {'connect_timeout': int(os.getenv('DB_REPLICA_CONNECT_TIMEOUT', 2))},
+            # Replicas hold the primary's data, so the test runner must not create empty databases for them
+            'TEST': {'MIRROR': 'default'},
+        }
+        FAQ_READ_REPLICAS.append(f'replica_{index}')
+
+# Send FAQ/Translation/Language reads to the replicas, with failover and read-your-writes pinning
+DATABASE_ROUTERS = ['api.routers.FAQReplicaRouter']
+FAQ_REPLICA_PIN_SECONDS = int(os.getenv('FAQ_REPLICA_PIN_SECONDS', 5))  # A writing client reads from the primary this long
+FAQ_REPLICA_HEALTH_TTL = int(os.getenv('FAQ_REPLICA_HEALTH_TTL', 10))  # Seconds a replica health check result is reused
+# Seconds a cache refill served by a replica is kept; like the pin window it should exceed the replica lag
+FAQ_REPLICA_CACHE_TTL = int(os.getenv('FAQ_REPLICA_CACHE_TTL', FAQ_REPLICA_PIN_SECONDS))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -154,6 +186,11 @@ CACHES = {
     }
 }
 
+# Cached FAQ payloads are stored in a compact columnar encoding (see api/caching.py)
+# and zlib-compressed once they reach this many bytes
+FAQ_CACHE_COMPRESS_MIN_BYTES = int(os.getenv('FAQ_CACHE_COMPRESS_MIN_BYTES', 1024))
+FAQ_CACHE_COMPRESS_LEVEL = int(os.getenv('FAQ_CACHE_COMPRESS_LEVEL', 6))
+
 
 ALLOWED_HOSTS = [
     'bharatfdassignment-97kk.onrender.com',